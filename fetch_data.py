@@ -8,24 +8,142 @@ Bitcoin Indicators - Data Fetcher
 Generates: data.json (live data) + btc_history.json (full CSV history)
 """
 
-import json
+import asyncio
+import functools
+import hashlib
+import io
 import csv
-import requests
-from datetime import datetime, timedelta
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import ijson
+import numpy as np
+import orjson
+import pandas as pd
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
 import os
 
+# Cache DNS lookups for the process lifetime: each host is resolved once
+# instead of per connection. DNS TTLs are ignored, which is fine for a
+# script that runs for seconds.
+socket.getaddrinfo = functools.lru_cache(maxsize=32)(socket.getaddrinfo)
+
+# Verbose progress output is opt-in; CI runs only see warnings and errors
+VERBOSE = os.environ.get('VERBOSE') == '1'
+
+logger = logging.getLogger(__name__)
+
 # Configuration
 DATA_FILE = 'data.json'
 BTC_HISTORY_FILE = 'btc_history.json'
 BTC_CSV_FILE = 'BTC_USD.csv'
 
+EPOCH = date(1970, 1, 1)
+
+# HTTP settings shared by all API fetches
+HTTP_HEADERS = {
+    'Accept-Encoding': 'br, gzip',
+    'User-Agent': 'btc-feargreed/1.0'
+}
+HTTP_TIMEOUT = httpx.Timeout(15.0, connect=3.05)
+HTTP_LIMITS = httpx.Limits(max_connections=8)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# On-disk response cache; upstream data is daily so warm re-runs skip the network
+HTTP_CACHE_DIR = '.http_cache'
+
+
+def _cache_path(url, params):
+    key = hashlib.sha1(orjson.dumps([url, params])).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, key + '.json')
+
+
+async def _request_bytes(session, url, params=None, headers=None):
+    """GET raw response bytes, retrying with backoff on rate limits and 5xx.
+
+    Returns None on 304 Not Modified (conditional requests only).
+    """
+
+    last_error = None
+
+    for attempt in range(RETRY_TOTAL + 1):
+        if attempt > 0:
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** (attempt - 1)))
+
+        try:
+            response = await session.get(url, params=params, headers=headers)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in RETRY_STATUSES:
+                raise
+            last_error = e
+        except httpx.HTTPError as e:
+            last_error = e
+
+    raise last_error
+
+
+async def get_bytes(session, url, params=None, ttl=None, headers=None):
+    """GET response bytes, served from the on-disk cache while fresh.
+
+    A stale cache entry is still used if the request itself fails
+    (stale-if-error), so a flaky endpoint doesn't blank out a column.
+    Returns None when the server answers 304 Not Modified.
+    """
+
+    cache_file = _cache_path(url, params) if ttl is not None else None
+
+    if cache_file and os.path.exists(cache_file):
+        age = time.time() - os.path.getmtime(cache_file)
+        if age < ttl.total_seconds():
+            with open(cache_file, 'rb') as f:
+                return f.read()
+
+    try:
+        raw = await _request_bytes(session, url, params=params, headers=headers)
+    except Exception:
+        if cache_file and os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                return f.read()
+        raise
+
+    if cache_file and raw is not None:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            f.write(raw)
+
+    return raw
+
+
+async def get_json(session, url, params=None, ttl=None, headers=None):
+    """GET a JSON endpoint via get_bytes and decode with orjson.
+
+    Returns None when the server answers 304 Not Modified.
+    """
+    raw = await get_bytes(session, url, params=params, ttl=ttl, headers=headers)
+    return None if raw is None else orjson.loads(raw)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_data_file(path, mtime):
+    """Parse a JSON file, cached on (path, mtime) for warm re-invocations"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
 
 def load_existing_data():
     """Load existing data.json to preserve accumulated PCR history"""
     if os.path.exists(DATA_FILE):
         try:
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
+            return _load_data_file(DATA_FILE, os.path.getmtime(DATA_FILE))
         except:
             pass
     return None
@@ -34,10 +152,10 @@ def load_existing_data():
 def generate_btc_history_json():
     """Convert BTC_USD.csv to btc_history.json for frontend use"""
     if not os.path.exists(BTC_CSV_FILE):
-        print(f"[INFO] {BTC_CSV_FILE} not found, skipping historical data generation")
+        logger.warning(f"[INFO] {BTC_CSV_FILE} not found, skipping historical data generation")
         return False
 
-    print(f"[CSV] Reading {BTC_CSV_FILE}...")
+    logger.info(f"[CSV] Reading {BTC_CSV_FILE}...")
 
     prices = {}
     with open(BTC_CSV_FILE, 'r') as f:
@@ -50,15 +168,15 @@ def generate_btc_history_json():
             except (ValueError, KeyError):
                 continue
 
-    with open(BTC_HISTORY_FILE, 'w') as f:
-        json.dump(prices, f)
+    with open(BTC_HISTORY_FILE, 'wb') as f:
+        f.write(orjson.dumps(prices))
 
     dates = sorted(prices.keys())
-    print(f"   [OK] Generated {BTC_HISTORY_FILE}: {len(prices)} days ({dates[0]} ~ {dates[-1]})")
+    logger.info(f"   [OK] Generated {BTC_HISTORY_FILE}: {len(prices)} days ({dates[0]} ~ {dates[-1]})")
     return True
 
 
-def fetch_bitcoin_price():
+async def fetch_bitcoin_price(session):
     """Fetch 12 months of daily Bitcoin price from CoinGecko"""
 
     url = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
@@ -69,27 +187,45 @@ def fetch_bitcoin_price():
         'interval': 'daily'
     }
 
-    print("[API] Fetching BTC price from CoinGecko (12 months)...")
+    logger.info("[API] Fetching BTC price from CoinGecko (12 months)...")
+
+    raw = await get_bytes(session, url, params=params, ttl=timedelta(hours=1))
 
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
+    # Stream just the 'prices' array into preallocated buffers instead of
+    # materializing the whole payload as nested Python lists
+    capacity = params['days'] + 2
+    timestamps = np.empty(capacity, dtype=np.int64)
+    prices = np.empty(capacity, dtype=np.float64)
+    count = 0
+
+    for timestamp, price in ijson.items(io.BytesIO(raw), 'prices.item'):
+        if count == capacity:
+            capacity *= 2
+            timestamps = np.resize(timestamps, capacity)
+            prices = np.resize(prices, capacity)
+        timestamps[count] = timestamp
+        prices[count] = float(price)
+        count += 1
 
     prices_by_date = {}
 
-    for item in data['prices']:
-        timestamp = item[0] / 1000
-        date = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
-        price = item[1]
-        prices_by_date[date] = round(price, 2)
+    if count:
+        # Vectorized ms-timestamp -> ISO date conversion
+        dates = timestamps[:count].astype('datetime64[ms]').astype('datetime64[D]').astype(str)
+        prices_by_date = dict(zip(dates.tolist(), np.round(prices[:count], 2).tolist()))
 
-    print(f"   [OK] Got {len(prices_by_date)} days of price data")
+    logger.info(f"   [OK] Got {len(prices_by_date)} days of price data")
 
     return prices_by_date
 
 
-def fetch_fear_greed():
-    """Fetch Fear & Greed Index from alternative.me (max available)"""
+async def fetch_fear_greed(session, cached=None, last_modified=None):
+    """Fetch Fear & Greed Index from alternative.me (max available).
+
+    With a cached date->value dict from a previous run, only the missing
+    tail of days is requested (published values are immutable) and an
+    If-Modified-Since header lets the server answer 304.
+    """
 
     url = "https://api.alternative.me/fng/"
 
@@ -98,44 +234,57 @@ def fetch_fear_greed():
         'limit': 0,
         'format': 'json'
     }
+    headers = None
 
-    print("[API] Fetching Fear & Greed Index from alternative.me (all available)...")
+    if cached:
+        # Only fetch days after the newest cached entry (+1 refreshes today)
+        missing = (datetime.now(timezone.utc).date() - date.fromisoformat(max(cached))).days
+        params['limit'] = max(1, missing + 1)
+        if last_modified:
+            headers = {'If-Modified-Since': last_modified}
+
+    logger.info("[API] Fetching Fear & Greed Index from alternative.me (all available)...")
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = await get_json(session, url, params=params, ttl=timedelta(hours=6),
+                              headers=headers)
+
+        if data is None:
+            # 304 Not Modified - cached history is still current
+            logger.info(f"   [OK] Not modified; reusing {len(cached)} cached days")
+            return dict(cached)
 
-        fng_by_date = {}
+        fng_by_date = dict(cached) if cached else {}
 
-        if 'data' in data:
-            for item in data['data']:
-                timestamp = int(item['timestamp'])
-                date = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
-                value = int(item['value'])
-                fng_by_date[date] = value
+        items = data.get('data')
+        if items:
+            # Whole-day UTC timestamps: integer day arithmetic, no strftime
+            fng_by_date.update({
+                (EPOCH + timedelta(days=int(item['timestamp']) // 86_400)).isoformat(): int(item['value'])
+                for item in items
+            })
 
-        print(f"   [OK] Got {len(fng_by_date)} days of Fear & Greed data")
+        logger.info(f"   [OK] Got {len(fng_by_date)} days of Fear & Greed data")
         if fng_by_date:
             dates = sorted(fng_by_date.keys())
-            print(f"   [OK] Range: {dates[0]} ~ {dates[-1]}")
+            logger.info(f"   [OK] Range: {dates[0]} ~ {dates[-1]}")
         return fng_by_date
 
     except Exception as e:
-        print(f"   [ERR] Error fetching Fear & Greed: {e}")
+        logger.error(f"   [ERR] Error fetching Fear & Greed: {e}")
         return {}
 
 
-def fetch_deribit_dvol():
+async def fetch_deribit_dvol(session):
     """Fetch DVOL (Bitcoin Volatility Index) from Deribit"""
 
-    print("[API] Fetching DVOL (VIX) from Deribit...")
+    logger.info("[API] Fetching DVOL (VIX) from Deribit...")
 
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=365)
-
-    start_timestamp = int(start_time.timestamp() * 1000)
-    end_timestamp = int(end_time.timestamp() * 1000)
+    # One clock read; rounded to the hour so the cache key stays stable
+    # between close runs
+    now = datetime.now(timezone.utc)
+    end_timestamp = int(now.timestamp() // 3600) * 3600 * 1000
+    start_timestamp = end_timestamp - 365 * 86_400_000
 
     url = "https://www.deribit.com/api/v2/public/get_volatility_index_data"
 
@@ -147,31 +296,30 @@ def fetch_deribit_dvol():
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = await get_json(session, url, params=params, ttl=timedelta(hours=1))
 
         dvol_by_date = {}
 
-        if 'result' in data and 'data' in data['result']:
-            for item in data['result']['data']:
-                timestamp = item[0] / 1000
-                date = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
-                close_value = item[4]
-                dvol_by_date[date] = round(close_value, 2)
+        rows = data.get('result', {}).get('data')
+        if rows:
+            # Vectorized ms-timestamp -> ISO date conversion (column 4 = close)
+            arr = np.asarray(rows, dtype=np.float64)
+            dates = arr[:, 0].astype(np.int64).astype('datetime64[ms]').astype('datetime64[D]').astype(str)
+            closes = np.round(arr[:, 4], 2)
+            dvol_by_date = dict(zip(dates.tolist(), closes.tolist()))
 
-        print(f"   [OK] Got {len(dvol_by_date)} days of DVOL data")
+        logger.info(f"   [OK] Got {len(dvol_by_date)} days of DVOL data")
         return dvol_by_date
 
     except Exception as e:
-        print(f"   [ERR] Error fetching DVOL: {e}")
+        logger.error(f"   [ERR] Error fetching DVOL: {e}")
         return {}
 
 
 def fetch_ibit_put_call_ratio():
     """Fetch today's IBIT Put/Call ratio from Yahoo Finance using yfinance"""
 
-    print("[API] Fetching IBIT Put/Call ratio from Yahoo Finance...")
+    logger.info("[API] Fetching IBIT Put/Call ratio from Yahoo Finance...")
 
     try:
         import yfinance as yf
@@ -180,165 +328,177 @@ def fetch_ibit_put_call_ratio():
         expirations = ticker.options
 
         if not expirations:
-            print("   [ERR] No options data available for IBIT")
+            logger.error("   [ERR] No options data available for IBIT")
             return None
 
+        def fetch_chain(exp):
+            try:
+                return ticker.option_chain(exp)
+            except Exception:
+                return None
+
+        # Each option_chain call is a blocking Yahoo request; fetch them in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            chains = list(executor.map(fetch_chain, expirations))
+
         total_put_oi = 0
         total_call_oi = 0
 
-        for exp in expirations:
-            try:
-                opt = ticker.option_chain(exp)
+        for opt in chains:
+            if opt is None:
+                continue
 
-                if hasattr(opt, 'calls') and not opt.calls.empty:
-                    call_oi = opt.calls['openInterest'].fillna(0).sum()
-                    total_call_oi += call_oi
+            if hasattr(opt, 'calls') and not opt.calls.empty and 'openInterest' in opt.calls:
+                total_call_oi += np.nansum(opt.calls['openInterest'].to_numpy(dtype=np.float64, copy=False))
 
-                if hasattr(opt, 'puts') and not opt.puts.empty:
-                    put_oi = opt.puts['openInterest'].fillna(0).sum()
-                    total_put_oi += put_oi
+            if hasattr(opt, 'puts') and not opt.puts.empty and 'openInterest' in opt.puts:
+                total_put_oi += np.nansum(opt.puts['openInterest'].to_numpy(dtype=np.float64, copy=False))
 
-            except Exception as e:
-                continue
+        # Back to native ints: OI counts are whole numbers, and the ratio must
+        # stay a plain float so data.json never carries numpy scalars
+        total_put_oi = int(total_put_oi)
+        total_call_oi = int(total_call_oi)
 
         if total_call_oi == 0:
-            print("   [ERR] No call open interest data")
+            logger.error("   [ERR] No call open interest data")
             return None
 
         pcr = round(total_put_oi / total_call_oi, 4)
 
-        print(f"   [OK] Put OI: {total_put_oi:,}, Call OI: {total_call_oi:,}")
-        print(f"   [OK] Put/Call Ratio: {pcr}")
+        logger.info(f"   [OK] Put OI: {total_put_oi:,}, Call OI: {total_call_oi:,}")
+        logger.info(f"   [OK] Put/Call Ratio: {pcr}")
 
         return pcr
 
     except ImportError:
-        print("   [ERR] yfinance not installed. Run: pip install yfinance")
+        logger.error("   [ERR] yfinance not installed. Run: pip install yfinance")
         return None
     except Exception as e:
-        print(f"   [ERR] Error fetching IBIT PCR: {e}")
+        logger.error(f"   [ERR] Error fetching IBIT PCR: {e}")
         return None
 
 
+async def fetch_all(cached_fng=None, last_modified=None):
+    """Run the independent API fetches concurrently"""
+
+    async with httpx.AsyncClient(http2=True,
+                                 headers=HTTP_HEADERS,
+                                 timeout=HTTP_TIMEOUT,
+                                 limits=HTTP_LIMITS) as session:
+        loop = asyncio.get_running_loop()
+        # yfinance is blocking, so run it in a thread alongside the async fetches
+        pcr_future = loop.run_in_executor(None, fetch_ibit_put_call_ratio)
+
+        btc_prices, fng_index, vix_index = await asyncio.gather(
+            fetch_bitcoin_price(session),
+            fetch_fear_greed(session, cached_fng, last_modified),
+            fetch_deribit_dvol(session)
+        )
+
+        today_pcr = await pcr_future
+
+    return btc_prices, fng_index, vix_index, today_pcr
+
+
 def align_data(btc_prices, fng_index, vix_index):
     """Align all data to union of all dates (not just BTC)"""
 
-    # Union of ALL dates from all sources
-    all_dates_set = set()
-    all_dates_set.update(btc_prices.keys())
-    all_dates_set.update(fng_index.keys())
-    all_dates_set.update(vix_index.keys())
-    all_dates = sorted(all_dates_set)
-
-    final_dates = []
-    final_prices = []
-    final_fng = []
-    final_vix = []
-
-    for date in all_dates:
-        final_dates.append(date)
-
-        # BTC price - direct or None (frontend fills from btc_history.json)
-        final_prices.append(btc_prices.get(date, None))
-
-        # Fear & Greed - direct or nearest within 3 days
-        if date in fng_index:
-            final_fng.append(fng_index[date])
-        else:
-            nearest = find_nearest_value(date, fng_index, 3)
-            final_fng.append(nearest)
-
-        # VIX/DVOL - direct or nearest within 3 days
-        if date in vix_index:
-            final_vix.append(vix_index[date])
-        else:
-            nearest = find_nearest_value(date, vix_index, 3)
-            final_vix.append(nearest)
-
-    return final_dates, final_prices, final_fng, final_vix
+    # Outer join gives the union of ALL dates from all sources
+    df = pd.concat({
+        'btc': pd.Series(btc_prices, dtype='float64'),
+        'fng': pd.Series(fng_index, dtype='float64'),
+        'vix': pd.Series(vix_index, dtype='float64')
+    }, axis=1)
 
+    if df.empty:
+        return [], [], [], []
 
-def find_nearest_value(target_date, data_dict, max_days):
-    """Find nearest value within max_days"""
-    if not data_dict:
-        return None
+    df.index = pd.to_datetime(df.index)
+    df = df.sort_index()
 
-    target = datetime.strptime(target_date, '%Y-%m-%d')
+    # Fill FNG/VIX gaps on a daily grid so the 3-day limit counts days, not rows.
+    # BTC stays as-is (frontend fills missing days from btc_history.json).
+    daily = df.reindex(pd.date_range(df.index.min(), df.index.max(), freq='D'))
+    daily[['fng', 'vix']] = daily[['fng', 'vix']].ffill(limit=3).bfill(limit=3)
+    df[['fng', 'vix']] = daily.loc[df.index, ['fng', 'vix']]
 
-    nearest_value = None
-    min_diff = max_days + 1
+    # NaN -> None once in pandas; tolist() then materializes each list in one pass
+    obj = df.astype(object).where(df.notna(), None)
 
-    for date_str, value in data_dict.items():
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        diff = abs((target - date_obj).days)
-        if diff < min_diff:
-            min_diff = diff
-            nearest_value = value
+    final_dates = df.index.strftime('%Y-%m-%d').tolist()
+    final_prices = obj['btc'].tolist()
+    final_fng = [v if v is None else int(v) for v in obj['fng'].tolist()]
+    final_vix = obj['vix'].tolist()
 
-    return nearest_value
+    return final_dates, final_prices, final_fng, final_vix
 
 
 def update_pcr_history(existing_data, today_pcr):
     """Update PCR history with today's value"""
 
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = datetime.now(timezone.utc).date().isoformat()
 
-    if existing_data and 'pcr_dates' in existing_data and 'pcr_index' in existing_data:
-        pcr_dates = existing_data['pcr_dates']
-        pcr_values = existing_data['pcr_index']
-    else:
-        pcr_dates = []
-        pcr_values = []
+    pcr = {}
+    if existing_data:
+        pcr = dict(zip(existing_data.get('pcr_dates', []),
+                       existing_data.get('pcr_index', [])))
 
     if today_pcr is not None:
-        if today not in pcr_dates:
-            pcr_dates.append(today)
-            pcr_values.append(today_pcr)
-            print(f"[PCR] Added PCR for {today}: {today_pcr}")
-        else:
-            idx = pcr_dates.index(today)
-            pcr_values[idx] = today_pcr
-            print(f"[PCR] Updated PCR for {today}: {today_pcr}")
+        action = 'Updated' if today in pcr else 'Added'
+        pcr[today] = today_pcr
+        logger.info(f"[PCR] {action} PCR for {today}: {today_pcr}")
 
-    if len(pcr_dates) > 365:
-        pcr_dates = pcr_dates[-365:]
-        pcr_values = pcr_values[-365:]
+    # Keep only the most recent 365 entries
+    if len(pcr) > 365:
+        pcr = dict(sorted(pcr.items())[-365:])
 
-    return pcr_dates, pcr_values
+    return list(pcr.keys()), list(pcr.values())
 
 
 def main():
-    print("=== Bitcoin Indicators Data Fetch ===\n")
+    logging.basicConfig(level=logging.INFO if VERBOSE else logging.WARNING,
+                        format='%(message)s')
+
+    logger.info("=== Bitcoin Indicators Data Fetch ===\n")
 
     existing_data = load_existing_data()
 
     # Generate btc_history.json from CSV
     generate_btc_history_json()
 
-    # Fetch Bitcoin price (12 months live)
-    btc_prices = fetch_bitcoin_price()
+    # Reuse accumulated Fear & Greed history so only the missing tail is fetched
+    cached_fng = {}
+    last_modified = None
+    if existing_data:
+        cached_fng = {
+            d: v for d, v in zip(existing_data.get('dates', []),
+                                 existing_data.get('fng_index', []))
+            if v is not None
+        }
+        if existing_data.get('last_updated'):
+            try:
+                updated = datetime.fromisoformat(
+                    existing_data['last_updated'].replace('Z', '+00:00'))
+                last_modified = format_datetime(updated, usegmt=True)
+            except ValueError:
+                pass
+
+    # Fetch BTC price, Fear & Greed, DVOL and IBIT PCR concurrently
+    btc_prices, fng_index, vix_index, today_pcr = asyncio.run(
+        fetch_all(cached_fng, last_modified))
 
     if not btc_prices:
-        print("[ERR] Could not fetch Bitcoin price")
+        logger.error("[ERR] Could not fetch Bitcoin price")
         return
 
-    # Fetch Fear & Greed Index (all available history)
-    fng_index = fetch_fear_greed()
-
-    # Fetch DVOL (VIX)
-    vix_index = fetch_deribit_dvol()
-
-    # Fetch IBIT Put/Call Ratio
-    today_pcr = fetch_ibit_put_call_ratio()
-
     # Align data
-    print("\n[MERGE] Aligning data...")
+    logger.info("\n[MERGE] Aligning data...")
     dates, prices, fng, vix = align_data(btc_prices, fng_index, vix_index)
-    print(f"   [OK] Aligned {len(dates)} data points")
+    logger.info(f"   [OK] Aligned {len(dates)} data points")
 
     # Update PCR history
     pcr_dates, pcr_values = update_pcr_history(existing_data, today_pcr)
-    print(f"   [OK] PCR history: {len(pcr_dates)} data points")
+    logger.info(f"   [OK] PCR history: {len(pcr_dates)} data points")
 
     # Save to JSON
     output = {
@@ -348,24 +508,25 @@ def main():
         'vix_index': vix,
         'pcr_dates': pcr_dates,
         'pcr_index': pcr_values,
-        'last_updated': datetime.utcnow().isoformat() + 'Z'
+        'last_updated': datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
     }
 
-    with open(DATA_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    with open(DATA_FILE, 'wb') as f:
+        f.write(orjson.dumps(
+            output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
-    print(f"\n[SAVE] Saved to {DATA_FILE}")
-    print(f"   Date range: {dates[0]} to {dates[-1]}")
+    logger.info(f"\n[SAVE] Saved to {DATA_FILE}")
+    logger.info(f"   Date range: {dates[0]} to {dates[-1]}")
     # Find latest non-null price
     latest_price = next((p for p in reversed(prices) if p is not None), 0)
-    print(f"   Latest BTC: ${latest_price:,.0f}")
+    logger.info(f"   Latest BTC: ${latest_price:,.0f}")
 
     latest_fng = fng[-1] if fng[-1] is not None else 'N/A'
     latest_vix = vix[-1] if vix[-1] is not None else 'N/A'
     latest_pcr = pcr_values[-1] if pcr_values else 'N/A'
-    print(f"   Latest Fear & Greed: {latest_fng}")
-    print(f"   Latest DVOL: {latest_vix}")
-    print(f"   Latest Put/Call: {latest_pcr}")
+    logger.info(f"   Latest Fear & Greed: {latest_fng}")
+    logger.info(f"   Latest DVOL: {latest_vix}")
+    logger.info(f"   Latest Put/Call: {latest_pcr}")
 
 
 if __name__ == '__main__':